@@ -1,16 +1,11 @@
 from __future__ import division
 
-import six
-
+import copy
+import multiprocessing.pool
 import os
 import random
-import shutil
 import string
 
-import verta
-from verta import Client
-
-import hypothesis
 import pytest
 import utils
 
@@ -24,9 +19,14 @@ DEFAULT_EMAIL = None
 DEFAULT_DEV_KEY = None
 
 
-# hypothesis on Jenkins is apparently too slow
-hypothesis.settings.register_profile("default", suppress_health_check=[hypothesis.HealthCheck.too_slow])
-hypothesis.settings.load_profile("default")
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: logs and deploys models through the back end; deselect with -m \"not slow\"")
+
+    import hypothesis
+
+    # hypothesis on Jenkins is apparently too slow
+    hypothesis.settings.register_profile("default", suppress_health_check=[hypothesis.HealthCheck.too_slow])
+    hypothesis.settings.load_profile("default")
 
 
 @pytest.fixture(scope='session')
@@ -49,150 +49,158 @@ def dev_key():
     return os.environ.get("VERTA_DEV_KEY", DEFAULT_DEV_KEY)
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def seed():
     return RANDOM_SEED
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def nones():
     return [None]*INPUT_LENGTH
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def bools(seed):
-    random.seed(seed)
-    return [bool(random.randint(0, 1)) for _ in range(INPUT_LENGTH)]
+    rng = random.Random(seed)
+    return [bool(rng.randint(0, 1)) for _ in range(INPUT_LENGTH)]
 
 
-@pytest.fixture
-def floats(seed):
-    random.seed(seed)
-    return [random.uniform(-3**2, 3**3) for _ in range(INPUT_LENGTH)]
+@pytest.fixture(scope='session')
+def _floats(seed):
+    rng = random.Random(seed)
+    return [rng.uniform(-3**2, 3**3) for _ in range(INPUT_LENGTH)]
 
 
 @pytest.fixture
+def floats(_floats):
+    """copy of session-scoped values, because some tests pop() from it"""
+    return list(_floats)
+
+
+@pytest.fixture(scope='session')
 def ints(seed):
-    random.seed(seed)
-    return [random.randint(-3**4, 3**5) for _ in range(INPUT_LENGTH)]
+    rng = random.Random(seed)
+    return [rng.randint(-3**4, 3**5) for _ in range(INPUT_LENGTH)]
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def strs(seed):
     """no duplicates"""
-    random.seed(seed)
-    gen_str = lambda: ''.join(random.choice(string.ascii_letters) for _ in range(INPUT_LENGTH))
-    result = set()
+    rng = random.Random(seed)
+    result = []
+    seen = set()
     while len(result) < INPUT_LENGTH:
-        single_str = gen_str()
-        while single_str in result:
-            single_str = gen_str()
-        else:
-            result.add(single_str)
-    return list(result)
+        single_str = ''.join(rng.choice(string.ascii_letters) for _ in range(INPUT_LENGTH))
+        if single_str not in seen:
+            seen.add(single_str)
+            result.append(single_str)
+    return result
 
 
-@pytest.fixture
-def flat_lists(seed, nones, bools, floats, ints, strs):
-    random.seed(seed)
-    values = (nones, bools, floats, ints, strs)
+@pytest.fixture(scope='session')
+def flat_lists(seed, nones, bools, _floats, ints, strs):
+    rng = random.Random(seed)
+    values = (nones, bools, _floats, ints, strs)
+    type_indices = [
+        [rng.randrange(len(values)) for _ in range(INPUT_LENGTH)]
+        for _ in range(INPUT_LENGTH)
+    ]
     return [
         [
-            values[random.choice(range(len(values)))][i]
-            for i in range(INPUT_LENGTH)
+            values[type_index][i]
+            for i, type_index in enumerate(row)
         ]
-        for _ in range(INPUT_LENGTH)
+        for row in type_indices
     ]
 
 
-@pytest.fixture
-def flat_dicts(seed, nones, bools, floats, ints, strs):
-    random.seed(seed)
-    values = (nones, bools, floats, ints, strs)
+@pytest.fixture(scope='session')
+def flat_dicts(seed, nones, bools, _floats, ints, strs):
+    rng = random.Random(seed)
+    values = (nones, bools, _floats, ints, strs)
+    type_indices = [
+        [rng.randrange(len(values)) for _ in range(INPUT_LENGTH)]
+        for _ in range(INPUT_LENGTH)
+    ]
     return [
         {
-            strs[i]: values[random.choice(range(len(values)))][i]
-            for i in range(INPUT_LENGTH)
+            strs[i]: values[type_index][i]
+            for i, type_index in enumerate(row)
         }
-        for _ in range(INPUT_LENGTH)
+        for row in type_indices
     ]
 
 
-@pytest.fixture
-def nested_lists(seed, nones, bools, floats, ints, strs):
-    random.seed(seed)
-    values = (nones, bools, floats, ints, strs)
+@pytest.fixture(scope='session')
+def nested_lists(seed, nones, bools, _floats, ints, strs):
+    rng = random.Random(seed)
+    values = (nones, bools, _floats, ints, strs)
     flat_values = [value for type_values in values for value in type_values]
-    def gen_value(p=1):
-        if random.random() < p:
-            return [
-                gen_value(p/2)
-                for _ in range(random.choice(range(4)))
-            ]
-        else:
-            return random.choice(flat_values)
+    def gen_value():
+        result = [None]
+        stack = [(result, 0, 1)]  # (container, index to fill, probability of nesting)
+        while stack:
+            parent, i, p = stack.pop()
+            if rng.random() < p:
+                parent[i] = [None]*rng.randrange(4)
+                stack.extend((parent[i], j, p/2) for j in reversed(range(len(parent[i]))))
+            else:
+                parent[i] = rng.choice(flat_values)
+        return result[0]
     return [
         [
             gen_value()
-            for _ in range(random.choice(range(3))+1)
+            for _ in range(rng.randrange(1, 4))
         ]
         for _ in range(INPUT_LENGTH)
     ]
 
 
-@pytest.fixture
-def nested_dicts(seed, nones, bools, floats, ints, strs):
-    random.seed(seed)
-    values = (nones, bools, floats, ints, strs)
+@pytest.fixture(scope='session')
+def nested_dicts(seed, nones, bools, _floats, ints, strs):
+    rng = random.Random(seed)
+    values = (nones, bools, _floats, ints, strs)
     flat_values = [value for type_values in values for value in type_values]
-    def gen_value(p=1):
-        if random.random() < p:
-            return {
-                key: gen_value(p/2)
-                for key, _ in zip(strs, range(random.choice(range(4))))
-            }
-        else:
-            return random.choice(flat_values)
+    def gen_value():
+        result = [None]
+        stack = [(result, 0, 1)]  # (container, key to fill, probability of nesting)
+        while stack:
+            parent, key, p = stack.pop()
+            if rng.random() < p:
+                parent[key] = {}
+                stack.extend((parent[key], child_key, p/2) for child_key in reversed(strs[:rng.randrange(4)]))
+            else:
+                parent[key] = rng.choice(flat_values)
+        return result[0]
     return [
         {
             key: gen_value()
-            for key, _ in zip(strs, range(random.choice(range(3))+1))
+            for key, _ in zip(strs, range(rng.randrange(1, 4)))
         }
         for _ in range(INPUT_LENGTH)
     ]
 
 
-@pytest.fixture
-def scalar_values(nones, bools, floats, ints, strs):
+@pytest.fixture(scope='session')
+def scalar_values(nones, bools, _floats, ints, strs):
     return [type_values[0]
-            for type_values in (nones, bools, floats, ints, strs)]
+            for type_values in (nones, bools, _floats, ints, strs)]
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def collection_values(flat_lists, flat_dicts, nested_lists, nested_dicts):
     return [type_values[0]
             for type_values in (flat_lists, flat_dicts, nested_lists, nested_dicts)]
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def all_values(scalar_values, collection_values):
     return scalar_values + collection_values
 
 
 @pytest.fixture(scope='session')
-def output_path():
-    dirpath = ".outputs"
-    while len(dirpath) < 1024:
-        try:  # avoid name collisions
-            os.mkdir(dirpath)
-        except OSError:
-            dirpath += '_'
-        else:
-            yield os.path.join(dirpath, "{}")
-            break
-    else:
-        raise RuntimeError("dirpath length exceeded 1024")
-    shutil.rmtree(dirpath)
+def output_path(tmp_path_factory):
+    return os.path.join(str(tmp_path_factory.mktemp("outputs")), "{}")
 
 
 @pytest.fixture
@@ -223,14 +231,50 @@ def dir_and_files(strs, tmp_path):
     return str(tmp_path), filepaths
 
 
+@pytest.fixture(scope='session')
+def session_client(host, port, email, dev_key):
+    """Client shared across tests, to only verify the connection once per session."""
+    import requests
+    from verta import Client
+
+    try:
+        return Client(host, port, email, dev_key, debug=True)
+    except requests.ConnectionError:  # pytest caches this skip for every test that needs a client
+        pytest.skip("unable to connect to ModelDB back end at {}".format(host))
+
+
+@pytest.fixture(scope='session')
+def created_project_ids(session_client):
+    """Container to track Projects created during tests, and clean them up at the end of the session."""
+    created_project_ids = []
+
+    yield created_project_ids
+
+    if created_project_ids:
+        # utils.delete_project() goes through requests.delete(), which opens a new Session for each
+        # call, so the threads share no connection state
+        pool = multiprocessing.pool.ThreadPool(16)
+        try:
+            pool.map(lambda id_: utils.delete_project(id_, session_client._conn),
+                     set(created_project_ids))
+        finally:
+            pool.close()
+            pool.join()
+
+
 @pytest.fixture
-def client(host, port, email, dev_key):
-    client = Client(host, port, email, dev_key, debug=True)
+def client(session_client, created_project_ids):
+    """`session_client` with its per-test state reset."""
+    client = session_client
+    client.proj = None
+    client.expt = None
+    conf = copy.copy(client._conf)
 
     yield client
 
+    client._conf = conf  # tests may modify config through entities, which share it
     if client.proj is not None:
-        utils.delete_project(client.proj.id, client._conn)
+        created_project_ids.append(client.proj.id)
 
 
 @pytest.fixture
@@ -240,6 +284,39 @@ def experiment_run(client):
     return client.set_experiment_run()
 
 
+@pytest.fixture(scope='class')
+def class_entities(session_client, created_project_ids):
+    """
+    Project, Experiment, and Experiment Run shared by a test class.
+
+    These are created over `session_client`'s connection without being set on it, so they are
+    independent of the per-test state that `client` resets.
+
+    Returns
+    -------
+    proj : :class:`verta.client.Project`
+    expt : :class:`verta.client.Experiment`
+    expt_run : :class:`verta.client.ExperimentRun`
+
+    """
+    from verta.client import Project, Experiment, ExperimentRun
+
+    conn, conf = session_client._conn, copy.copy(session_client._conf)
+    proj = Project(conn, conf)
+    created_project_ids.append(proj.id)
+    expt = Experiment(conn, conf, proj.id)
+    expt_run = ExperimentRun(conn, conf, proj.id, expt.id)
+
+    return proj, expt, expt_run
+
+
+@pytest.fixture(scope='class')
+def class_experiment_run(class_entities):
+    """Experiment Run shared by a test class; its tests must log under distinct keys."""
+    _, _, expt_run = class_entities
+    return expt_run
+
+
 @pytest.fixture
 def created_datasets(client):
     """Container to track and clean up Datasets created during tests."""
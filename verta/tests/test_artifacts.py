@@ -1,7 +1,6 @@
 import pytest
 
-import six
-
+import io
 import os
 import sys
 import zipfile
@@ -26,18 +25,22 @@ class TestArtifacts:
         strs, holdout = strs[:-1], strs[-1]  # reserve last key
         all_values = (value  # log_artifact treats str value as filepath to open
                       for value in all_values if not isinstance(value, str))
+        artifacts = list(zip(strs, all_values))
 
-        for key, artifact in zip(strs, all_values):
+        for key, artifact in artifacts:
             experiment_run.log_artifact(key, artifact)
 
-        for key, artifact in zip(strs, all_values):
-            assert experiment_run.get_artifact(key) == artifact
+        # retrieve concurrently to overlap request round trips
+        retrieved_artifacts = utils.map_with_own_session(lambda run, key: run.get_artifact(key),
+                                                         experiment_run, [key for key, _ in artifacts])
+        assert retrieved_artifacts == [artifact for _, artifact in artifacts]
 
         with pytest.raises(KeyError):
             experiment_run.get_artifact(holdout)
 
     def test_upload_file(self, experiment_run, strs):
-        filepaths = (filepath for filepath in os.listdir('.') if filepath.endswith('.py'))
+        filepaths = (entry.name for entry in os.scandir('.')
+                     if entry.name.endswith('.py') and entry.is_file())
         artifacts = list(zip(strs, filepaths))
 
         # log using file handle
@@ -49,10 +52,24 @@ class TestArtifacts:
         for key, artifact_filepath in artifacts[len(artifacts)//2:]:
             experiment_run.log_artifact(key, artifact_filepath)
 
-        # get
-        for key, artifact_filepath in artifacts:
+        # get concurrently to overlap request round trips
+        retrieved_digests = utils.map_with_own_session(lambda run, key: utils.digest(run.get_artifact(key)),
+                                                       experiment_run, [key for key, _ in artifacts])
+        for (_, artifact_filepath), retrieved_digest in zip(artifacts, retrieved_digests):
             with open(artifact_filepath, 'rb') as artifact_file:
-                assert experiment_run.get_artifact(key).read() == artifact_file.read()
+                assert retrieved_digest == utils.digest(artifact_file)
+
+    def test_upload_filepath(self, experiment_run, strs, tmp_path):
+        """a file logged by its path is streamed from disk byte-for-byte"""
+        key = strs[0]
+        contents = os.urandom(2**17)  # arbitrary bytes, spanning several read chunks
+        filepath = tmp_path / key
+        filepath.write_bytes(contents)
+
+        experiment_run.log_artifact(key, str(filepath))
+
+        retrieved_contents, _ = experiment_run._get_artifact(key)
+        assert retrieved_contents == contents
 
     def test_upload_dir(self, experiment_run, strs, dir_and_files):
         dirpath, filepaths = dir_and_files
@@ -67,33 +84,51 @@ class TestArtifacts:
         """uploading empty data, e.g. an empty file, raises an error"""
 
         with pytest.raises(ValueError):
-            experiment_run.log_artifact(strs[0], six.BytesIO())
+            experiment_run.log_artifact(strs[0], io.BytesIO())
+
+    def test_empty_file(self, experiment_run, strs, tmp_path):
+        """uploading an empty file by its path raises an error"""
+        filepath = tmp_path / strs[0]
+        filepath.touch()
+
+        with pytest.raises(ValueError):
+            experiment_run.log_artifact(strs[0], str(filepath))
 
     def test_conflict(self, experiment_run, strs, all_values):
-        all_values = (value  # log_artifact treats str value as filepath to open
-                      for value in all_values if not isinstance(value, str))
+        all_values = [value  # log_artifact treats str value as filepath to open
+                      for value in all_values if not isinstance(value, str)]
+        artifacts = list(zip(strs, all_values))
 
-        for key, artifact in zip(strs, all_values):
+        for key, artifact in artifacts:
             experiment_run.log_artifact(key, artifact)
             with pytest.raises(ValueError):
                 experiment_run.log_artifact(key, artifact)
 
-        for key, artifact in reversed(list(zip(strs, all_values))):
+        for key, artifact in reversed(artifacts):
             with pytest.raises(ValueError):
                 experiment_run.log_artifact(key, artifact)
 
 
+@pytest.fixture(scope='module')
+def cnn_input(seed):
+    """Batch of random 32x32 RGB images, generated directly as float32."""
+    torch = pytest.importorskip("torch")
+
+    return torch.rand((36, 3, 32, 32), generator=torch.Generator().manual_seed(seed))
+
+
 class TestModels:
     def test_sklearn(self, seed, experiment_run, strs):
         np = pytest.importorskip("numpy")
         sklearn = pytest.importorskip("sklearn")
+        joblib = pytest.importorskip("joblib")
         from sklearn import cluster, naive_bayes, pipeline, preprocessing
 
-        np.random.seed(seed)
+        rng = np.random.RandomState(seed)
         key = strs[0]
         num_data_rows = 36
-        X = np.random.random((num_data_rows, 2))
-        y = np.random.randint(10, size=num_data_rows)
+        X = rng.random_sample((num_data_rows, 2))
+        y = rng.randint(10, size=num_data_rows)
 
         pipeline = sklearn.pipeline.make_pipeline(
             sklearn.preprocessing.StandardScaler(),
@@ -101,29 +136,26 @@ class TestModels:
             sklearn.naive_bayes.GaussianNB(),
         )
         pipeline.fit(X, y)
+        expected = pipeline.predict(X)
 
         experiment_run.log_model(pipeline)
         retrieved_pipeline = experiment_run.get_model()
 
-        assert np.allclose(pipeline.predict(X), retrieved_pipeline.predict(X))
-
-        assert len(pipeline.steps) == len(retrieved_pipeline.steps)
-        for step, retrieved_step in zip(pipeline.steps, retrieved_pipeline.steps):
-            assert step[0] == retrieved_step[0]  # step name
-            assert step[1].get_params() == retrieved_step[1].get_params()  # step model
+        assert np.array_equal(expected, retrieved_pipeline.predict(X))
+        assert joblib.hash(pipeline) == joblib.hash(retrieved_pipeline)  # steps' params and fitted state
 
-    def test_torch(self, seed, experiment_run, strs):
+    def test_torch(self, seed, experiment_run, strs, cnn_input):
         np = pytest.importorskip("numpy")
         torch = pytest.importorskip("torch")
         import torch.nn as nn
         import torch.nn.functional as F
         import torch.optim as optim
 
-        np.random.seed(seed)
+        rng = np.random.RandomState(seed)
         key = strs[0]
-        num_data_rows = 36
-        X = torch.tensor(np.random.random((num_data_rows, 3, 32, 32)), dtype=torch.float)
-        y = torch.tensor(np.random.randint(10, size=num_data_rows), dtype=torch.long)
+        X = cnn_input
+        num_data_rows = len(X)
+        y = torch.from_numpy(rng.randint(10, size=num_data_rows, dtype=np.int64))  # shares memory, as torch.long
 
         class Model(nn.Module):
             def __init__(self):
@@ -156,22 +188,23 @@ class TestModels:
         experiment_run.log_model(net)
         retrieved_net = experiment_run.get_model()
 
-        assert torch.allclose(net(X), retrieved_net(X))
+        assert torch.allclose(net(X), retrieved_net(X))  # forward pass need not be bitwise reproducible
 
-        assert net.state_dict().keys() == retrieved_net.state_dict().keys()
-        for key, weight in net.state_dict().items():
-            assert torch.allclose(weight, retrieved_net.state_dict()[key])
+        state_dict, retrieved_state_dict = net.state_dict(), retrieved_net.state_dict()
+        assert state_dict.keys() == retrieved_state_dict.keys()
+        for key, weight in state_dict.items():
+            assert torch.equal(weight, retrieved_state_dict[key])  # serialization is lossless
 
     def test_keras(self, seed, experiment_run, strs):
         np = pytest.importorskip("numpy")
         tensorflow = pytest.importorskip("tensorflow")
         from tensorflow import keras
 
-        np.random.seed(seed)
+        rng = np.random.RandomState(seed)
         key = strs[0]
         num_data_rows = 36
-        X = np.random.random((num_data_rows, 28, 28))
-        y = np.random.random(num_data_rows)
+        X = rng.random_sample((num_data_rows, 28, 28))
+        y = rng.random_sample(num_data_rows)
 
         net = keras.models.Sequential([
             keras.layers.Flatten(input_shape=(28, 28)),
@@ -229,14 +262,27 @@ class TestModels:
         assert experiment_run.get_model().predict(strs) == custom.predict(strs)
 
 
+@pytest.fixture(scope='module')
+def gray_image():
+    """Blank image shared across tests; tests that draw on it should use a copy."""
+    PIL = pytest.importorskip("PIL")
+    import PIL.Image
+
+    return PIL.Image.new('RGB', (64, 64), 'gray')
+
+
 class TestImages:
     @staticmethod
     def matplotlib_to_pil(fig):
+        """Renders `fig` (a Figure or pyplot) the way ``log_image()`` does, minus the PNG round trip."""
         PIL = pytest.importorskip("PIL")
+        import PIL.Image
 
-        bytestream = six.BytesIO()
-        fig.savefig(bytestream)
-        return PIL.Image.open(bytestream)
+        figure = fig.gcf() if hasattr(fig, 'gcf') else fig  # pyplot or Figure
+        bytestream = io.BytesIO()
+        figure.savefig(bytestream, format='rgba', dpi=figure.dpi)  # raw pixels, no zlib
+        return PIL.Image.frombuffer('RGBA', figure.canvas.get_width_height(), bytestream.getvalue(),
+                                    'raw', 'RGBA', 0, 1)
 
     def test_log_path(self, experiment_run, strs):
         strs, holdout = strs[:-1], strs[-1]  # reserve last key
@@ -259,60 +305,69 @@ class TestImages:
         with pytest.warns(UserWarning):
             experiment_run.log_image(key, img)
 
-    def test_upload_plt(self, experiment_run, strs):
+    def test_upload_plt(self, seed, class_experiment_run, strs):
         np = pytest.importorskip("numpy")
         matplotlib = pytest.importorskip("matplotlib")
         matplotlib.use("Agg")  # https://stackoverflow.com/a/37605654
         import matplotlib.pyplot as plt
 
-        key = strs[0]
-        plt.scatter(*np.random.random((2, 10)))
+        key = "plt_{}".format(strs[0])  # distinct within the shared run
+        rng = np.random.RandomState(seed)
+        plt.scatter(*rng.random_sample((2, 10)))
+        expected_image = self.matplotlib_to_pil(plt)
 
-        experiment_run.log_image(key, plt)
-        assert np.array_equal(np.asarray(experiment_run.get_image(key).getdata()),
-                              np.asarray(self.matplotlib_to_pil(plt).getdata()))
+        class_experiment_run.log_image(key, plt)
+        retrieved_image = class_experiment_run.get_image(key)
+        assert retrieved_image.mode == expected_image.mode
+        assert retrieved_image.size == expected_image.size
+        assert retrieved_image.tobytes() == expected_image.tobytes()
 
-    def test_upload_fig(self, experiment_run, strs):
+    def test_upload_fig(self, seed, class_experiment_run, strs):
         np = pytest.importorskip("numpy")
         matplotlib = pytest.importorskip("matplotlib")
         matplotlib.use("Agg")  # https://stackoverflow.com/a/37605654
         import matplotlib.pyplot as plt
 
-        key = strs[0]
+        key = "fig_{}".format(strs[0])  # distinct within the shared run
+        rng = np.random.RandomState(seed)
         fig, ax = plt.subplots()
-        ax.scatter(*np.random.random((2, 10)))
+        ax.scatter(*rng.random_sample((2, 10)))
+        expected_image = self.matplotlib_to_pil(fig)
 
-        experiment_run.log_image(key, fig)
-        assert np.array_equal(np.asarray(experiment_run.get_image(key).getdata()),
-                              np.asarray(self.matplotlib_to_pil(fig).getdata()))
+        class_experiment_run.log_image(key, fig)
+        retrieved_image = class_experiment_run.get_image(key)
+        assert retrieved_image.mode == expected_image.mode
+        assert retrieved_image.size == expected_image.size
+        assert retrieved_image.tobytes() == expected_image.tobytes()
 
-    def test_upload_pil(self, experiment_run, strs):
+    def test_upload_pil(self, seed, class_experiment_run, strs, gray_image):
         np = pytest.importorskip("numpy")
         PIL = pytest.importorskip("PIL")
         import PIL.ImageDraw
 
-        key = strs[0]
-        img = PIL.Image.new('RGB', (64, 64), 'gray')
-        PIL.ImageDraw.Draw(img).arc(np.r_[np.random.randint(32, size=(2)),
-                                          np.random.randint(32, 64, size=(2))].tolist(),
-                                    np.random.randint(360), np.random.randint(360),
+        key = "pil_{}".format(strs[0])  # distinct within the shared run
+        rng = np.random.RandomState(seed)
+        img = gray_image.copy()
+        PIL.ImageDraw.Draw(img).arc(np.r_[rng.randint(32, size=(2)),
+                                          rng.randint(32, 64, size=(2))].tolist(),
+                                    rng.randint(360), rng.randint(360),
                                     'white')
 
-        experiment_run.log_image(key, img)
-        assert(np.array_equal(np.asarray(experiment_run.get_image(key).getdata()),
-                              np.asarray(img.getdata())))
-
-    def test_conflict(self, experiment_run, strs):
-        PIL = pytest.importorskip("PIL")
+        class_experiment_run.log_image(key, img)
+        retrieved_image = class_experiment_run.get_image(key)
+        assert retrieved_image.mode == img.mode
+        assert retrieved_image.size == img.size
+        assert retrieved_image.tobytes() == img.tobytes()
 
-        images = dict(zip(strs, [PIL.Image.new('RGB', (64, 64), 'gray')]*3))
+    def test_conflict(self, experiment_run, strs, gray_image):
+        images = dict(zip(strs, [gray_image]*3))
 
-        for key, image in six.viewitems(images):
+        for key, image in images.items():
             experiment_run.log_image(key, image)
             with pytest.raises(ValueError):
                 experiment_run.log_image(key, image)
 
-        for key, image in reversed(list(six.viewitems(images))):
+        for key, image in reversed(list(images.items())):
             with pytest.raises(ValueError):
                 experiment_run.log_image(key, image)
 
@@ -343,7 +398,7 @@ class TestOverwrite:
         experiment_run.log_requirements(requirements)
         experiment_run.log_requirements(new_requirements, overwrite=True)
 
-        assert six.ensure_binary('\n'.join(new_requirements)) in experiment_run.get_artifact("requirements.txt").read()
+        assert '\n'.join(new_requirements).encode() in experiment_run.get_artifact("requirements.txt").read()
 
     def test_training_data(self, experiment_run):
         pd = pytest.importorskip("pandas")
@@ -371,4 +426,4 @@ class TestOverwrite:
         experiment_run.log_setup_script(setup_script)
         experiment_run.log_setup_script(new_setup_script, overwrite=True)
 
-        assert experiment_run.get_artifact("setup_script").read() == six.ensure_binary(new_setup_script)
+        assert experiment_run.get_artifact("setup_script").read() == new_setup_script.encode()
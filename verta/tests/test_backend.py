@@ -5,6 +5,31 @@ import multiprocessing
 import pytest
 
 
+NUM_WORKERS = 36
+NUM_RUNS = 144
+
+_worker_args = None
+
+
+def _init_worker(host, port, email, dev_key, expt_id, floats):
+    """
+    Connects a new Client once per worker process, rather than once per task.
+
+    The parent's Client is not passed in, so that workers don't share its HTTP connections.
+
+    """
+    from verta import Client
+
+    global _worker_args
+    client = Client(host, port, email, dev_key)
+    client.set_experiment(id=expt_id)
+    _worker_args = (client, floats)
+
+
+def _run_fake_experiment_in_worker(_):
+    TestLoad.run_fake_experiment(_worker_args)
+
+
 class TestLoad:
     @staticmethod
     def run_fake_experiment(args):
@@ -15,14 +40,13 @@ class TestLoad:
         run.log_attribute("is_test", True)
         run.get_attribute("is_test")
 
-        run.log_hyperparameters({
+        hyperparameters = {
             'C': next(floats),
             'solver': next(floats),
             'max_iter': next(floats),
-        })
-        run.get_hyperparameter("C")
-        run.get_hyperparameter("solver")
-        run.get_hyperparameter("max_iter")
+        }
+        run.log_hyperparameters(hyperparameters)
+        assert six.viewkeys(hyperparameters) <= six.viewkeys(run.get_hyperparameters())
 
         run.log_observation("rand_val", next(floats))
         run.log_observation("rand_val", next(floats))
@@ -36,9 +60,10 @@ class TestLoad:
         run.get_artifact("self")
 
     @pytest.mark.skipif(six.PY2, reason="multiprocessing.Pool has issues in Python 2")
-    def test_load(self, client, floats):
+    def test_load(self, client, host, port, email, dev_key, floats):
         client.set_project()
-        client.set_experiment()
-        pool = multiprocessing.Pool(36)
-        pool.map(self.run_fake_experiment, [(client, floats)]*144)
+        expt = client.set_experiment()
+        pool = multiprocessing.Pool(NUM_WORKERS, initializer=_init_worker,
+                                    initargs=(host, port, email, dev_key, expt.id, floats))
+        pool.map(_run_fake_experiment_in_worker, range(NUM_RUNS), chunksize=NUM_RUNS//NUM_WORKERS)
         pool.close()
@@ -2,9 +2,8 @@ import pytest
 
 import six
 
+import hashlib
 import os
-import time
-import shutil
 
 import utils
 
@@ -15,18 +14,44 @@ from verta._protos.public.modeldb import DatasetVersionService_pb2 as _DatasetVe
 
 
 DEFAULT_S3_TEST_BUCKET = "bucket"
-DEFAULT_S3_TEST_OBJECT = "object"
 DEFAULT_GOOGLE_APPLICATION_CREDENTIALS = "credentials.json"
 
+# enum values looked up once rather than through the proto module in every test
+PATH_TYPE = _DatasetService.DatasetTypeEnum.PATH
+QUERY_TYPE = _DatasetService.DatasetTypeEnum.QUERY
+RAW_TYPE = _DatasetService.DatasetTypeEnum.RAW
+
 
 @pytest.fixture(scope='session')
 def s3_bucket():
     return os.environ.get("VERTA_S3_TEST_BUCKET", DEFAULT_S3_TEST_BUCKET)
 
 
-@pytest.fixture(scope='session')
-def s3_object():
-    return os.environ.get("VERTA_S3_TEST_OBJECT", DEFAULT_S3_TEST_OBJECT)
+@pytest.fixture(scope='class')
+def mock_s3_bucket(strs):
+    """
+    Serves a small S3 bucket from moto instead of the network.
+
+    Class-scoped so that the mock is not active for tests that talk to real S3.
+
+    Returns
+    -------
+    bucket_name : str
+    object_sizes : dict of str to int
+
+    """
+    boto3 = pytest.importorskip("boto3")
+    moto = pytest.importorskip("moto")
+
+    bucket_name = "verta-test-bucket"
+    object_sizes = {strs[0]: 7, strs[1]: 13}
+    with moto.mock_s3():
+        conn = boto3.client('s3', region_name="us-east-1")
+        conn.create_bucket(Bucket=bucket_name)
+        for key, size in object_sizes.items():
+            conn.put_object(Bucket=bucket_name, Key=key, Body=b'0'*size)
+
+        yield bucket_name, object_sizes
 
 
 @pytest.fixture(scope='session')
@@ -43,19 +68,62 @@ def bq_location():
     return "US"
 
 
-class TestBaseDatasets:
-    def test_creation_from_scratch(self, client, created_datasets):
-        dataset = Dataset(client._conn, client._conf,
-                          dataset_type=_DatasetService.DatasetTypeEnum.PATH)
-        created_datasets.append(dataset)
-        assert dataset.dataset_type == _DatasetService.DatasetTypeEnum.PATH
-        assert dataset.id
+@pytest.fixture(scope='session')
+def bq_query_job_id(request, bq_query, bq_location):
+    """
+    Submits `bq_query` to BigQuery once per session.
 
-    def test_creation_by_id(self, client, created_datasets):
+    The job ID is persisted in the pytest cache, so later sessions reuse the completed job instead
+    of re-running the query, as long as BigQuery still has a record of it.
+
+    """
+    google = pytest.importorskip("google")
+    bigquery = pytest.importorskip("google.cloud.bigquery")
+    from google.api_core import exceptions as gcp_exceptions
+
+    cache_key = "verta/bq_job_id/{}".format(
+        hashlib.sha1(six.ensure_binary(bq_location + bq_query)).hexdigest())
+
+    try:
+        bq_client = google.cloud.bigquery.Client()
+
+        job_id = request.config.cache.get(cache_key, None)
+        if job_id is not None:
+            try:
+                bq_client.get_job(job_id, location=bq_location)
+            except gcp_exceptions.NotFound:
+                job_id = None
+
+        if job_id is None:
+            job_id = bq_client.query(
+                bq_query,
+                # Location must match that of the dataset(s) referenced in the query.
+                location=bq_location,
+            ).job_id
+            request.config.cache.set(cache_key, job_id)
+    except google.auth.exceptions.GoogleAuthError:
+        pytest.skip("insufficient GCP credentials")
+
+    return job_id
+
+
+@pytest.fixture(scope='module')
+def path_dataset(session_client):
+    """PATH Dataset shared as the parent of versions by tests that don't depend on its other versions."""
+    dataset = session_client.set_dataset(type="local")
+
+    yield dataset
+
+    utils.delete_datasets([dataset.id], session_client._conn)
+
+
+@pytest.mark.parametrize("dataset_type", [PATH_TYPE, QUERY_TYPE], ids=["path", "query"])
+class TestBaseDatasets:
+    def test_creation_by_id(self, client, created_datasets, dataset_type):
         dataset = Dataset(client._conn, client._conf,
-                          dataset_type=_DatasetService.DatasetTypeEnum.PATH)
+                          dataset_type=dataset_type)
         created_datasets.append(dataset)
-        assert dataset.dataset_type == _DatasetService.DatasetTypeEnum.PATH
+        assert dataset.dataset_type == dataset_type
         assert dataset.id
 
         same_dataset = Dataset(client._conn, client._conf,
@@ -64,26 +132,12 @@ class TestBaseDatasets:
 
 
 class TestBaseDatasetVersions:
-    def test_creation_from_scratch(self, client, created_datasets):
-        dataset = Dataset(client._conn, client._conf,
-                          dataset_type=_DatasetService.DatasetTypeEnum.PATH)
-        created_datasets.append(dataset)
-        version = DatasetVersion(client._conn, client._conf,
-                                 dataset_id=dataset.id,
-                                 dataset_version_info=_DatasetVersionService.PathDatasetVersionInfo(),
-                                 dataset_type=_DatasetService.DatasetTypeEnum.PATH)
-        assert version.dataset_type == _DatasetService.DatasetTypeEnum.PATH
-        assert version.id
-
-    def test_creation_by_id(self, client, created_datasets):
-        dataset = Dataset(client._conn, client._conf,
-                          dataset_type=_DatasetService.DatasetTypeEnum.PATH)
-        created_datasets.append(dataset)
+    def test_creation_by_id(self, client, path_dataset):
         version = DatasetVersion(client._conn, client._conf,
-                                 dataset_id=dataset.id,
+                                 dataset_id=path_dataset.id,
                                  dataset_version_info=_DatasetVersionService.PathDatasetVersionInfo(),
-                                 dataset_type=_DatasetService.DatasetTypeEnum.PATH)
-        assert version.dataset_type == _DatasetService.DatasetTypeEnum.PATH
+                                 dataset_type=PATH_TYPE)
+        assert version.dataset_type == PATH_TYPE
         assert version.id
 
         same_version = DatasetVersion(client._conn, client._conf,
@@ -101,37 +155,11 @@ class TestRawDatasetVersions:
     pass
 
 
-class TestPathDatasets:
-    def test_creation_from_scratch(self, client, created_datasets):
-        dataset = Dataset(client._conn, client._conf,
-                          dataset_type=_DatasetService.DatasetTypeEnum.PATH)
-        created_datasets.append(dataset)
-        assert dataset.dataset_type == _DatasetService.DatasetTypeEnum.PATH
-        assert dataset.id
-
-    def test_creation_by_id(self, client, created_datasets):
-        dataset = Dataset(client._conn, client._conf,
-                          dataset_type=_DatasetService.DatasetTypeEnum.PATH)
-        created_datasets.append(dataset)
-        assert dataset.dataset_type == _DatasetService.DatasetTypeEnum.PATH
-        assert dataset.id
-
-        same_dataset = Dataset(client._conn, client._conf,
-                               _dataset_id=dataset.id)
-        assert dataset.id == same_dataset.id
-
-
 class TestClientDatasetFunctions:
-    def test_creation_from_scratch_client_api(self, client, created_datasets):
-        dataset = client.set_dataset(type="s3")
-        created_datasets.append(dataset)
-        assert dataset.dataset_type == _DatasetService.DatasetTypeEnum.PATH
-        assert dataset.id
-
     def test_creation_by_id_client_api(self, client, created_datasets):
         dataset = client.set_dataset(type="s3")
         created_datasets.append(dataset)
-        assert dataset.dataset_type == _DatasetService.DatasetTypeEnum.PATH
+        assert dataset.dataset_type == PATH_TYPE
         assert dataset.id
 
         same_dataset = client.set_dataset(id=dataset.id)
@@ -141,7 +169,7 @@ class TestClientDatasetFunctions:
     def test_get_dataset_client_api(self, client, created_datasets):
         dataset = client.set_dataset(type="s3")
         created_datasets.append(dataset)
-        assert dataset.dataset_type == _DatasetService.DatasetTypeEnum.PATH
+        assert dataset.dataset_type == PATH_TYPE
         assert dataset.id
 
         same_dataset = client.get_dataset(id=dataset.id)
@@ -156,18 +184,18 @@ class TestClientDatasetFunctions:
         tags = ["test1-{}".format(verta._utils.now()), "test2-{}".format(verta._utils.now())]
         dataset1 = client.set_dataset(type="big query", tags=tags)
         created_datasets.append(dataset1)
-        assert dataset1.dataset_type == _DatasetService.DatasetTypeEnum.QUERY
+        assert dataset1.dataset_type == QUERY_TYPE
         assert dataset1.id
 
         dataset2 = client.set_dataset(type="s3", tags=["test1"])
         created_datasets.append(dataset2)
-        assert dataset2.dataset_type == _DatasetService.DatasetTypeEnum.PATH
+        assert dataset2.dataset_type == PATH_TYPE
         assert dataset2.id
 
         # TODO: update once RAW is supported
         # dataset3 = client.set_dataset(type="raw")
         # created_datasets.append(dataset3)
-        # assert dataset3.dataset_type == _DatasetService.DatasetTypeEnum.RAW
+        # assert dataset3.dataset_type == RAW_TYPE
         # assert dataset3.id
 
         # datasets = client.find_datasets()
@@ -191,22 +219,28 @@ class TestClientDatasetFunctions:
         assert len(datasets) == 1
         assert datasets[0].id == dataset1.id
 
-
-class TestClientDatasetVersionFunctions:
-    def test_creation_from_scratch(self, client, created_datasets):
-        dataset = client.set_dataset(type="local")
+    def test_find_datasets_fields_client_api(self, client, created_datasets):
+        """Datasets built from the find query's response match those fetched by ID."""
+        tags = ["test-find-{}".format(verta._utils.now())]
+        dataset = client.set_dataset(type="local", desc="A test.", tags=tags)
         created_datasets.append(dataset)
 
-        version = dataset.create_version(__file__)
-        assert version.dataset_type == _DatasetService.DatasetTypeEnum.PATH
-        assert version.id
+        datasets = client.find_datasets(tags=tags)
+        assert len(datasets) == 1
+        found_dataset = datasets[0]
+
+        same_dataset = client.get_dataset(id=dataset.id)
+        assert found_dataset.id == same_dataset.id == dataset.id
+        assert found_dataset.name == same_dataset.name == dataset.name
+        assert found_dataset.dataset_type == same_dataset.dataset_type == PATH_TYPE
+        assert found_dataset.desc == same_dataset.desc == "A test."
+        assert list(found_dataset.tags) == list(same_dataset.tags) == tags
 
-    def test_creation_by_id(self, client, created_datasets):
-        dataset = client.set_dataset(type="local")
-        created_datasets.append(dataset)
 
-        version = dataset.create_version(__file__)
-        assert version.dataset_type == _DatasetService.DatasetTypeEnum.PATH
+class TestClientDatasetVersionFunctions:
+    def test_creation_by_id(self, client, path_dataset):
+        version = path_dataset.create_version(__file__)
+        assert version.dataset_type == PATH_TYPE
         assert version.id
 
         same_version = client.get_dataset_version(id=version.id)
@@ -217,11 +251,11 @@ class TestClientDatasetVersionFunctions:
         created_datasets.append(dataset)
 
         version1 = dataset.create_version(path=__file__)
-        assert version1.dataset_type == _DatasetService.DatasetTypeEnum.PATH
+        assert version1.dataset_type == PATH_TYPE
         assert version1.id
 
         version2 = dataset.create_version(path=pytest.__file__)
-        assert version2.dataset_type == _DatasetService.DatasetTypeEnum.PATH
+        assert version2.dataset_type == PATH_TYPE
         assert version2.id
 
         versions = dataset.get_all_versions()
@@ -249,29 +283,17 @@ class TestClientDatasetVersionFunctions:
         assert version.id == version1.id
 
 
-class TestPathBasedDatasetVersions:
-    def test_creation_from_scratch(self, client, created_datasets):
-        dataset = Dataset(client._conn, client._conf,
-                          dataset_type=_DatasetService.DatasetTypeEnum.PATH)
-        created_datasets.append(dataset)
-
-        version = DatasetVersion(client._conn, client._conf,
-                                 dataset_id=dataset.id,
-                                 dataset_version_info=_DatasetVersionService.PathDatasetVersionInfo(),
-                                 dataset_type=_DatasetService.DatasetTypeEnum.PATH)
-        assert version.dataset_type == _DatasetService.DatasetTypeEnum.PATH
-        assert version.id
-
+class TestQueryDatasetVersions:
     def test_creation_by_id(self, client, created_datasets):
         dataset = Dataset(client._conn, client._conf,
-                          dataset_type=_DatasetService.DatasetTypeEnum.PATH)
+                          dataset_type=QUERY_TYPE)
         created_datasets.append(dataset)
 
         version = DatasetVersion(client._conn, client._conf,
                                  dataset_id=dataset.id,
-                                 dataset_version_info=_DatasetVersionService.PathDatasetVersionInfo(),
-                                 dataset_type=_DatasetService.DatasetTypeEnum.PATH)
-        assert version.dataset_type == _DatasetService.DatasetTypeEnum.PATH
+                                 dataset_version_info=_DatasetVersionService.QueryDatasetVersionInfo(),
+                                 dataset_type=QUERY_TYPE)
+        assert version.dataset_type == QUERY_TYPE
         assert version.id
 
         same_version = DatasetVersion(client._conn, client._conf,
@@ -279,103 +301,94 @@ class TestPathBasedDatasetVersions:
         assert version.id == same_version.id
 
 
-class TestQueryDatasets:
-    def test_creation_from_scratch(self, client, created_datasets):
-        dataset = Dataset(client._conn, client._conf,
-                          dataset_type=_DatasetService.DatasetTypeEnum.DatasetType.QUERY)
-        created_datasets.append(dataset)
-        assert dataset.dataset_type == _DatasetService.DatasetTypeEnum.DatasetType.QUERY
-        assert dataset.id
+def create_dir_with_files(dir_name, num_files=10):
+    """Creates `num_files` files that each contain 7 bytes in the existing directory `dir_name`."""
+    file_names = ["{}.txt".format(num_file) for num_file in range(num_files)]
+    contents = b'123456\n'
+    for file_name in file_names:
+        fd = os.open(os.path.join(dir_name, file_name), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, contents)
+        finally:
+            os.close(fd)
+    return file_names
 
-    def test_creation_by_id(self, client, created_datasets):
-        dataset = Dataset(client._conn, client._conf,
-                          dataset_type=_DatasetService.DatasetTypeEnum.DatasetType.QUERY)
-        created_datasets.append(dataset)
-        assert dataset.dataset_type == _DatasetService.DatasetTypeEnum.DatasetType.QUERY
-        assert dataset.id
 
-        same_dataset = Dataset(client._conn, client._conf,
-                               _dataset_id=dataset.id)
-        assert dataset.id == same_dataset.id
+@pytest.fixture(scope='module')
+def dir_with_files(request, tmp_path_factory):
+    """
+    Directory of files shared by this module's tests, which only read it.
 
+    The number of files defaults to 10, and can be set through indirect parametrization; one
+    directory is built per number of files.
 
-class TestQueryDatasetVersions:
-    def test_creation_from_scratch(self, client, created_datasets):
-        dataset = Dataset(client._conn, client._conf,
-                          dataset_type=_DatasetService.DatasetTypeEnum.DatasetType.QUERY)
-        created_datasets.append(dataset)
-
-        version = DatasetVersion(client._conn, client._conf,
-                                 dataset_id=dataset.id,
-                                 dataset_version_info=_DatasetVersionService.QueryDatasetVersionInfo(),
-                                 dataset_type=_DatasetService.DatasetTypeEnum.QUERY)
-        assert version.dataset_type == _DatasetService.DatasetTypeEnum.QUERY
-        assert version.id
-
-    def test_creation_by_id(self, client, created_datasets):
-        dataset = Dataset(client._conn, client._conf,
-                          dataset_type=_DatasetService.DatasetTypeEnum.QUERY)
-        created_datasets.append(dataset)
-
-        version = DatasetVersion(client._conn, client._conf,
-                                 dataset_id=dataset.id,
-                                 dataset_version_info=_DatasetVersionService.QueryDatasetVersionInfo(),
-                                 dataset_type=_DatasetService.DatasetTypeEnum.QUERY)
-        assert version.dataset_type == _DatasetService.DatasetTypeEnum.QUERY
-        assert version.id
-
-        same_version = DatasetVersion(client._conn, client._conf,
-                                      _dataset_version_id=version.id)
-        assert version.id == same_version.id
+    """
+    num_files = getattr(request, 'param', 10)
+    dir_name = str(tmp_path_factory.mktemp("FSD"))  # pytest handles uniqueness and cleanup
+    file_names = create_dir_with_files(dir_name, num_files=num_files)
+    return dir_name, file_names
 
 
 class TestFileSystemDatasetVersionInfo:
-    def test_single_file(self):
-        dir_name, file_names = self.create_dir_with_files(num_files=1)
+    @pytest.mark.parametrize("dir_with_files", [1], indirect=True)
+    def test_single_file(self, dir_with_files):
+        dir_name, file_names = dir_with_files
         fsdvi = FilesystemDatasetVersionInfo(dir_name + "/" + file_names[0])
         assert len(fsdvi.dataset_part_infos) == 1
         assert fsdvi.size == 7
-        shutil.rmtree(dir_name)
 
-    def test_dir(self):
-        dir_name, _ = self.create_dir_with_files(num_files=10)
+    def test_dir(self, dir_with_files):
+        dir_name, file_names = dir_with_files
         fsdvi = FilesystemDatasetVersionInfo(dir_name)
-        assert len(fsdvi.dataset_part_infos) == 10
-        assert fsdvi.size == 70
-        shutil.rmtree(dir_name)
-
-    def create_dir_with_files(self, num_files=10):
-        dir_name = 'FSD:' + str(time.time())
-        file_names = []
-        os.mkdir(dir_name)
-        for num_file in range(num_files):
-            file_name = str(num_file) + ".txt"
-            f = open(dir_name + "/" + file_name, 'w')
-            f.write('123456\n')
-            file_names.append(file_name)
-        return dir_name, file_names
+        assert len(fsdvi.dataset_part_infos) == len(file_names)
+        assert fsdvi.size == 7*len(file_names)
+
+    def test_unchanged_file_not_rehashed(self, tmp_path, monkeypatch):
+        filepath = tmp_path / "file.txt"
+        filepath.write_bytes(b'123456\n')
+        os.utime(str(filepath), (0, 0))  # modified long enough ago for its checksum to be cached
+        checksum = FilesystemDatasetVersionInfo(str(filepath)).dataset_part_infos[0].checksum
+
+        monkeypatch.setattr(verta._dataset, "hashlib", None)  # hashing the file again would raise
+        assert FilesystemDatasetVersionInfo(str(filepath)).dataset_part_infos[0].checksum == checksum
+
+    def test_modified_file_rehashed(self, tmp_path):
+        filepath = tmp_path / "file.txt"
+        filepath.write_bytes(b'123456\n')
+        os.utime(str(filepath), (0, 0))  # modified long enough ago for its checksum to be cached
+        FilesystemDatasetVersionInfo(str(filepath))
+
+        filepath.write_bytes(b'654321\n')  # same size, new mtime
+        checksum = FilesystemDatasetVersionInfo(str(filepath)).dataset_part_infos[0].checksum
+        assert checksum == hashlib.md5(b'654321\n').hexdigest()
+
+    def test_rewritten_within_mtime_tick_rehashed(self, tmp_path):
+        filepath = tmp_path / "file.txt"
+        filepath.write_bytes(b'123456\n')
+        mtime_ns = os.stat(str(filepath)).st_mtime_ns
+        FilesystemDatasetVersionInfo(str(filepath))
+
+        filepath.write_bytes(b'654321\n')  # same size
+        os.utime(str(filepath), ns=(mtime_ns, mtime_ns))  # as if rewritten within the same tick
+        checksum = FilesystemDatasetVersionInfo(str(filepath)).dataset_part_infos[0].checksum
+        assert checksum == hashlib.md5(b'654321\n').hexdigest()
 
 
 class TestS3DatasetVersionInfo:
-    def test_single_object(self, s3_bucket, s3_object):
-        botocore = pytest.importorskip("botocore")
+    def test_single_object(self, mock_s3_bucket):
+        bucket_name, object_sizes = mock_s3_bucket
+        key, size = next(iter(object_sizes.items()))
 
-        try:
-            s3dvi = S3DatasetVersionInfo(s3_bucket, s3_object)
-            assert len(s3dvi.dataset_part_infos) == 1
-            assert s3dvi.size > 0
-        except botocore.exceptions.ClientError:
-            pytest.skip("insufficient AWS credentials")
+        s3dvi = S3DatasetVersionInfo(bucket_name, key)
+        assert len(s3dvi.dataset_part_infos) == 1
+        assert s3dvi.size == size
 
-    def test_bucket(self, s3_bucket):
-        botocore = pytest.importorskip("botocore")
+    def test_bucket(self, mock_s3_bucket):
+        bucket_name, object_sizes = mock_s3_bucket
 
-        try:
-            s3dvi = S3DatasetVersionInfo(s3_bucket)
-            assert len(s3dvi.dataset_part_infos) >= 1
-            assert s3dvi.size > 0
-        except botocore.exceptions.ClientError:
-            pytest.skip("insufficient AWS credentials")
+        s3dvi = S3DatasetVersionInfo(bucket_name)
+        assert len(s3dvi.dataset_part_infos) == len(object_sizes)
+        assert s3dvi.size == sum(object_sizes.values())
 
 
 class TestS3ClientFunctions:
@@ -385,7 +398,7 @@ class TestS3ClientFunctions:
         try:
             dataset = client.set_dataset(type="s3")
             created_datasets.append(dataset)
-            assert dataset.dataset_type == _DatasetService.DatasetTypeEnum.PATH
+            assert dataset.dataset_type == PATH_TYPE
         except botocore.exceptions.ClientError:
             pytest.skip("insufficient AWS credentials")
 
@@ -406,48 +419,31 @@ class TestFilesystemClientFunctions:
     def test_filesystem_dataset_creation(self, client, created_datasets):
         dataset = client.set_dataset(type="local")
         created_datasets.append(dataset)
-        assert dataset.dataset_type == _DatasetService.DatasetTypeEnum.PATH
+        assert dataset.dataset_type == PATH_TYPE
 
-    def test_filesystem_dataset_version_creation(self, client, created_datasets):
-        dir_name, _ = self.create_dir_with_files(num_files=3)
+    @pytest.mark.parametrize("dir_with_files", [3], indirect=True)
+    def test_filesystem_dataset_version_creation(self, client, created_datasets, dir_with_files):
+        dir_name, file_names = dir_with_files
         dataset = client.set_dataset(type="local")
         created_datasets.append(dataset)
         dataset_version = dataset.create_version(dir_name)
 
-        assert len(dataset_version.dataset_version_info.dataset_part_infos) == 3
-        shutil.rmtree(dir_name)
-
-    def create_dir_with_files(self, num_files=10):
-        dir_name = 'FSD:' + str(time.time())
-        file_names = []
-        os.mkdir(dir_name)
-        for num_file in range(num_files):
-            file_name = str(num_file) + ".txt"
-            f = open(dir_name + "/" + file_name, 'w')
-            f.write('123456\n')
-            file_names.append(file_name)
-        return dir_name, file_names
+        assert len(dataset_version.dataset_version_info.dataset_part_infos) == len(file_names)
 
 
 class TestBigQueryDatasetVersionInfo:
     def test_big_query_dataset(self, client, created_datasets):
         dataset = client.set_dataset(type="big query")
         created_datasets.append(dataset)
-        assert dataset.dataset_type == _DatasetService.DatasetTypeEnum.QUERY
+        assert dataset.dataset_type == QUERY_TYPE
 
-    def test_big_query_dataset_version_creation(self, client, bq_query, bq_location, created_datasets):
+    def test_big_query_dataset_version_creation(self, client, bq_query, bq_location, bq_query_job_id, created_datasets):
         google = pytest.importorskip("google")
-        bigquery = pytest.importorskip("google.cloud.bigquery")
 
         try:
-            query_job = google.cloud.bigquery.Client().query(
-                bq_query,
-                # Location must match that of the dataset(s) referenced in the query.
-                location=bq_location,
-            )
             dataset = client.set_dataset(type="big query")
             created_datasets.append(dataset)
-            dataset_version = dataset.create_version(job_id=query_job.job_id, location=bq_location)
+            dataset_version = dataset.create_version(job_id=bq_query_job_id, location=bq_location)
 
             assert dataset_version.dataset_version_info.query == bq_query
         except google.auth.exceptions.GoogleAuthError:
@@ -457,7 +453,7 @@ class TestRDBMSDatasetVersionInfo:
     def test_rdbms_dataset(self, client, created_datasets):
         dataset = client.set_dataset(type="postgres")
         created_datasets.append(dataset)
-        assert dataset.dataset_type == _DatasetService.DatasetTypeEnum.QUERY
+        assert dataset.dataset_type == QUERY_TYPE
 
     def test_rdbms_version_creation(self, client, created_datasets):
         dataset = client.set_dataset(type="postgres")
@@ -474,7 +470,7 @@ class TestLogDatasetVersion:
     def test_log_dataset_version(self, client, created_datasets, experiment_run):
         dataset = client.set_dataset(type="local")
         created_datasets.append(dataset)
-        assert dataset.dataset_type == _DatasetService.DatasetTypeEnum.PATH
+        assert dataset.dataset_type == PATH_TYPE
 
         dataset_version = dataset.create_version(__file__)
         experiment_run.log_dataset_version('train', dataset_version)
@@ -486,7 +482,7 @@ class TestLogDatasetVersion:
     def test_overwrite(self, client, created_datasets, experiment_run, s3_bucket):
         dataset = client.set_dataset(type="local")
         created_datasets.append(dataset)
-        assert dataset.dataset_type == _DatasetService.DatasetTypeEnum.PATH
+        assert dataset.dataset_type == PATH_TYPE
 
         dataset_version = dataset.create_version(__file__)
         experiment_run.log_dataset_version('train', dataset_version)
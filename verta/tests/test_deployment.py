@@ -5,6 +5,7 @@ import six
 import glob
 import json
 import os
+import re
 import shutil
 import sys
 import tarfile
@@ -17,25 +18,48 @@ import requests
 import verta
 
 
-@pytest.fixture
-def model_for_deployment(strs):
+pytestmark = pytest.mark.slow  # every test here uploads a model and/or waits on a deployment
+
+REQ_NAME_REGEX = re.compile(r"^\s*([a-zA-Z0-9._-]+)", re.MULTILINE)  # package name at the start of each line
+
+
+@pytest.fixture(scope='module')
+def training_data(strs):
+    """Training features and targets shared by this module's tests, which only read them."""
     np = pytest.importorskip("numpy")
     pd = pytest.importorskip("pandas")
-    sklearn = pytest.importorskip("sklearn")
-    from sklearn import linear_model
 
     num_rows, num_cols = 36, 6
 
-    data = pd.DataFrame(np.tile(np.arange(num_rows).reshape(-1, 1),
-                                num_cols),
+    data = pd.DataFrame(np.broadcast_to(np.arange(num_rows).reshape(-1, 1),
+                                        (num_rows, num_cols)),
                         columns=strs[:num_cols])
     X_train = data.iloc[:,:-1]  # pylint: disable=bad-whitespace
     y_train = data.iloc[:, -1]
 
+    return X_train, y_train
+
+
+@pytest.fixture(scope='module')
+def training_data_csv(training_data):
+    """`training_data` as it is expected to be logged by the client."""
+    X_train, y_train = training_data
+
+    return X_train.join(y_train).to_csv(index=False)
+
+
+@pytest.fixture
+def model_for_deployment(training_data):
+    """Fresh model, model API, and requirements stream per test, since tests consume or modify them."""
+    sklearn = pytest.importorskip("sklearn")
+    from sklearn import dummy
+
+    X_train, y_train = training_data
+
     return {
-        'model': sklearn.linear_model.LogisticRegression(),
+        'model': sklearn.dummy.DummyClassifier(),
         'model_api': verta.utils.ModelAPI(X_train, y_train),
-        'requirements': six.StringIO("scikit-learn=={}".format(sklearn.__version__)),
+        'requirements': six.BytesIO(six.ensure_binary("scikit-learn=={}".format(sklearn.__version__))),
         'train_features': X_train,
         'train_targets': y_train,
     }
@@ -63,30 +87,28 @@ class TestLogModelForDeployment:
         retrieved_model_api = verta.utils.ModelAPI.from_file(
             experiment_run.get_artifact("model_api.json"))
 
-        assert all(item in six.viewitems(retrieved_model_api.to_dict())
-                   for item in six.viewitems(model_for_deployment['model_api'].to_dict()))
+        assert (six.viewitems(model_for_deployment['model_api'].to_dict())
+                <= six.viewitems(retrieved_model_api.to_dict()))
 
     def test_reqs_on_disk(self, experiment_run, model_for_deployment, output_path):
+        requirements = model_for_deployment['requirements'].read()
         requirements_file = output_path.format("requirements.txt")
-        with open(requirements_file, 'w') as f:
-            f.write(model_for_deployment['requirements'].read())
-        model_for_deployment['requirements'] = open(requirements_file, 'r')  # replace with on-disk file
+        with open(requirements_file, 'wb') as f:
+            f.write(requirements)
 
-        experiment_run.log_model_for_deployment(**model_for_deployment)
-        retrieved_requirements = six.ensure_str(experiment_run.get_artifact("requirements.txt").read())
+        with open(requirements_file, 'rb') as f:
+            model_for_deployment['requirements'] = f  # replace with on-disk file
+            experiment_run.log_model_for_deployment(**model_for_deployment)
+        retrieved_requirements = experiment_run.get_artifact("requirements.txt").read()
 
-        with open(requirements_file, 'r') as f:
-            assert set(f.read().split()) <= set(retrieved_requirements.split())
+        assert set(requirements.split()) <= set(retrieved_requirements.split())
 
-    def test_with_data(self, experiment_run, model_for_deployment):
+    def test_with_data(self, experiment_run, model_for_deployment, training_data_csv):
         """`train_features` and `train_targets` are joined into a single CSV"""
         experiment_run.log_model_for_deployment(**model_for_deployment)
 
         data_csv = experiment_run.get_artifact("train_data").read()
-
-        X_train = model_for_deployment['train_features']
-        y_train = model_for_deployment['train_targets']
-        assert X_train.join(y_train).to_csv(index=False) == six.ensure_str(data_csv)
+        assert training_data_csv == six.ensure_str(data_csv)
 
 
 class TestLogModel:
@@ -439,66 +461,46 @@ class TestLogRequirements:
             experiment_run.log_requirements([self.NONSPECIFIC_REQ])
 
     def test_nonspecific_ver_file_warning(self, experiment_run):
-        with tempfile.NamedTemporaryFile('w+') as tempf:
-            tempf.write(self.NONSPECIFIC_REQ)
-            tempf.seek(0)
-
-            with pytest.warns(UserWarning):
-                experiment_run.log_requirements(tempf.name)
+        with pytest.warns(UserWarning):
+            experiment_run.log_requirements(six.StringIO(self.NONSPECIFIC_REQ))
 
     def test_invalid_pkg_name_list_error(self, experiment_run):
         with pytest.raises(ValueError):
             experiment_run.log_requirements([self.INVALID_REQ])
 
     def test_invalid_pkg_name_file_error(self, experiment_run):
-        with tempfile.NamedTemporaryFile('w+') as tempf:
-            tempf.write(self.INVALID_REQ)
-            tempf.seek(0)
-
-            with pytest.raises(ValueError):
-                experiment_run.log_requirements(tempf.name)
+        with pytest.raises(ValueError):
+            experiment_run.log_requirements(six.StringIO(self.INVALID_REQ))
 
     def test_unimportable_pkg_list_error(self, experiment_run):
         with pytest.raises(ValueError):
             experiment_run.log_requirements([self.UNIMPORTABLE_REQ])
 
     def test_unimportable_pkg_file_error(self, experiment_run):
-        with tempfile.NamedTemporaryFile('w+') as tempf:
-            tempf.write(self.UNIMPORTABLE_REQ)
-            tempf.seek(0)
-
-            with pytest.raises(ValueError):
-                experiment_run.log_requirements(tempf.name)
+        with pytest.raises(ValueError):
+            experiment_run.log_requirements(six.StringIO(self.UNIMPORTABLE_REQ))
 
     def test_verta_ver_mismatch_list_error(self, experiment_run):
         with pytest.raises(ValueError):
             experiment_run.log_requirements([self.VERTA_MISMATCH_REQ])
 
     def test_verta_ver_mismatch_file_error(self, experiment_run):
-        with tempfile.NamedTemporaryFile('w+') as tempf:
-            tempf.write(self.VERTA_MISMATCH_REQ)
-            tempf.seek(0)
-
-            with pytest.raises(ValueError):
-                experiment_run.log_requirements(tempf.name)
+        with pytest.raises(ValueError):
+            experiment_run.log_requirements(six.StringIO(self.VERTA_MISMATCH_REQ))
 
     def test_cloudpickle_ver_mismatch_list_error(self, experiment_run):
         with pytest.raises(ValueError):
             experiment_run.log_requirements([self.CLOUDPICKLE_MISMATCH_REQ])
 
     def test_cloudpickle_ver_mismatch_file_error(self, experiment_run):
-        with tempfile.NamedTemporaryFile('w+') as tempf:
-            tempf.write(self.CLOUDPICKLE_MISMATCH_REQ)
-            tempf.seek(0)
-
-            with pytest.raises(ValueError):
-                experiment_run.log_requirements(tempf.name)
+        with pytest.raises(ValueError):
+            experiment_run.log_requirements(six.StringIO(self.CLOUDPICKLE_MISMATCH_REQ))
 
     def test_injection_list(self, experiment_run):
         experiment_run.log_requirements([])
 
         reqs_txt = experiment_run.get_artifact("requirements.txt").read().decode()
-        reqs = set(req.split('==')[0].strip() for req in reqs_txt.splitlines())
+        reqs = set(REQ_NAME_REGEX.findall(reqs_txt))
         assert {'cloudpickle', 'verta'} == reqs
 
     def test_injection_file(self, experiment_run):
@@ -506,14 +508,14 @@ class TestLogRequirements:
             experiment_run.log_requirements(tempf.name)
 
         reqs_txt = experiment_run.get_artifact("requirements.txt").read().decode()
-        reqs = set(req.split('==')[0].strip() for req in reqs_txt.splitlines())
+        reqs = set(REQ_NAME_REGEX.findall(reqs_txt))
         assert {'cloudpickle', 'verta'} == reqs
 
     def test_list(self, experiment_run):
         experiment_run.log_requirements(self.VALID_REQS)
 
         reqs_txt = experiment_run.get_artifact("requirements.txt").read().decode()
-        reqs = set(req.split('==')[0].strip() for req in reqs_txt.splitlines())
+        reqs = set(REQ_NAME_REGEX.findall(reqs_txt))
         assert set(self.VALID_REQS) == reqs
 
     def test_file(self, experiment_run):
@@ -524,7 +526,7 @@ class TestLogRequirements:
             experiment_run.log_requirements(tempf.name)
 
         reqs_txt = experiment_run.get_artifact("requirements.txt").read().decode()
-        reqs = set(req.split('==')[0].strip() for req in reqs_txt.splitlines())
+        reqs = set(REQ_NAME_REGEX.findall(reqs_txt))
         assert set(self.VALID_REQS) == reqs
 
 
@@ -552,16 +554,16 @@ class TestLogTrainingData:
         with pytest.raises(ValueError):
             experiment_run.log_training_data(X_train, y_train)
 
-    def test_series(self, experiment_run, model_for_deployment):
+    def test_series(self, experiment_run, model_for_deployment, training_data_csv):
         X_train = model_for_deployment['train_features']
         y_train = model_for_deployment['train_targets']
 
         experiment_run.log_training_data(X_train, y_train)
 
         data_csv = experiment_run.get_artifact("train_data").read()
-        assert X_train.join(y_train).to_csv(index=False) == six.ensure_str(data_csv)
+        assert training_data_csv == six.ensure_str(data_csv)
 
-    def test_dataframe(self, experiment_run, model_for_deployment):
+    def test_dataframe(self, experiment_run, model_for_deployment, training_data_csv):
         X_train = model_for_deployment['train_features']
         y_train = model_for_deployment['train_targets']
 
@@ -570,7 +572,7 @@ class TestLogTrainingData:
         experiment_run.log_training_data(X_train, y_train)
 
         data_csv = experiment_run.get_artifact("train_data").read()
-        assert X_train.join(y_train).to_csv(index=False) == six.ensure_str(data_csv)
+        assert training_data_csv == six.ensure_str(data_csv)
 
 
 class TestDeploy:
@@ -22,6 +22,11 @@ KWARGS_COMBOS = [dict(zip(KWARGS.keys(), values))
                  if values.count(None) != len(values)]
 
 
+def kwargs_combo_id(kwargs):
+    """Names a `KWARGS_COMBOS` parametrization after its non-None arguments, e.g. "desc-tags"."""
+    return "-".join(key for key, value in sorted(kwargs.items()) if value is not None)
+
+
 class TestClient:
     def test_verta_https(self):
         hosts = [
@@ -107,13 +112,13 @@ class TestEntities:
 
 
 class TestProject:
-    def test_set_project_warning(self, client):
+    @pytest.mark.parametrize("kwargs", KWARGS_COMBOS, ids=kwargs_combo_id)
+    def test_set_project_warning(self, client, class_entities, kwargs):
         """setting Project by name with desc, tags, and/or attrs raises warning"""
-        proj = client.set_project()
+        proj, _, _ = class_entities
 
-        for kwargs in KWARGS_COMBOS:
-            with pytest.warns(UserWarning):
-                client.set_project(proj.name, **kwargs)
+        with pytest.warns(UserWarning):
+            client.set_project(proj.name, **kwargs)
 
     def test_create(self, client):
         assert client.set_project()
@@ -141,14 +146,13 @@ class TestProject:
 
 
 class TestExperiment:
-    def test_set_experiment_warning(self, client):
+    @pytest.mark.parametrize("kwargs", KWARGS_COMBOS, ids=kwargs_combo_id)
+    def test_set_experiment_warning(self, client, class_entities, kwargs):
         """setting Experiment by name with desc, tags, and/or attrs raises warning"""
-        client.set_project()
-        expt = client.set_experiment()
+        client.proj, expt, _ = class_entities
 
-        for kwargs in KWARGS_COMBOS:
-            with pytest.warns(UserWarning):
-                client.set_experiment(expt.name, **kwargs)
+        with pytest.warns(UserWarning):
+            client.set_experiment(expt.name, **kwargs)
 
     def test_create(self, client):
         client.set_project()
@@ -180,15 +184,13 @@ class TestExperiment:
 
 
 class TestExperimentRun:
-    def test_set_experiment_run_warning(self, client):
+    @pytest.mark.parametrize("kwargs", KWARGS_COMBOS, ids=kwargs_combo_id)
+    def test_set_experiment_run_warning(self, client, class_entities, kwargs):
         """setting ExperimentRun by name with desc, tags, and/or attrs raises warning"""
-        client.set_project()
-        client.set_experiment()
-        expt_run = client.set_experiment_run()
+        client.proj, client.expt, expt_run = class_entities
 
-        for kwargs in KWARGS_COMBOS:
-            with pytest.warns(UserWarning):
-                client.set_experiment_run(expt_run.name, **kwargs)
+        with pytest.warns(UserWarning):
+            client.set_experiment_run(expt_run.name, **kwargs)
 
     def test_create(self, client):
         client.set_project()
@@ -1,5 +1,3 @@
-import six
-
 import string
 
 import verta
@@ -52,13 +50,13 @@ class TestHyperparameters:
         strs, holdout = strs[:-1], strs[-1]  # reserve last key
         hyperparameters = dict(zip(strs, scalar_values))
 
-        for key, val in six.viewitems(hyperparameters):
+        for key, val in hyperparameters.items():
             experiment_run.log_hyperparameter(key, val)
 
         with pytest.raises(KeyError):
             experiment_run.get_hyperparameter(holdout)
 
-        for key, val in six.viewitems(hyperparameters):
+        for key, val in hyperparameters.items():
             assert experiment_run.get_hyperparameter(key) == val
 
         assert experiment_run.get_hyperparameters() == hyperparameters
@@ -72,7 +70,7 @@ class TestHyperparameters:
         with pytest.raises(KeyError):
             experiment_run.get_hyperparameter(holdout)
 
-        for key, val in six.viewitems(hyperparameters):
+        for key, val in hyperparameters.items():
             assert experiment_run.get_hyperparameter(key) == val
 
         assert experiment_run.get_hyperparameters() == hyperparameters
@@ -80,13 +78,13 @@ class TestHyperparameters:
     def test_conflict(self, experiment_run, strs, scalar_values):
         hyperparameters = dict(zip(strs, scalar_values))
 
-        for key, val in six.viewitems(hyperparameters):
+        for key, val in hyperparameters.items():
             experiment_run.log_hyperparameter(key, val)
             with pytest.raises(ValueError):
                 experiment_run.log_hyperparameter(key, val)
 
         # try it backwards, too
-        for key, val in reversed(list(six.viewitems(hyperparameters))):
+        for key, val in reversed(list(hyperparameters.items())):
             with pytest.raises(ValueError):
                 experiment_run.log_hyperparameter(key, val)
 
@@ -107,7 +105,7 @@ class TestHyperparameters:
         hyperparameters = dict(zip(strs, collection_values))
 
         # single
-        for key, val in six.viewitems(hyperparameters):
+        for key, val in hyperparameters.items():
             with pytest.raises(TypeError):
                 experiment_run.log_hyperparameter(key, val)
 
@@ -127,13 +125,13 @@ class TestAttributes:
         strs, holdout = strs[:-1], strs[-1]  # reserve last key
         attributes = dict(zip(strs, all_values))
 
-        for key, val in six.viewitems(attributes):
+        for key, val in attributes.items():
             experiment_run.log_attribute(key, val)
 
         with pytest.raises(KeyError):
             experiment_run.get_attribute(holdout)
 
-        for key, val in six.viewitems(attributes):
+        for key, val in attributes.items():
             assert experiment_run.get_attribute(key) == val
 
         assert experiment_run.get_attributes() == attributes
@@ -147,7 +145,7 @@ class TestAttributes:
         with pytest.raises(KeyError):
             experiment_run.get_attribute(holdout)
 
-        for key, val in six.viewitems(attributes):
+        for key, val in attributes.items():
             assert experiment_run.get_attribute(key) == val
 
         assert experiment_run.get_attributes() == attributes
@@ -155,13 +153,13 @@ class TestAttributes:
     def test_conflict(self, experiment_run, strs, all_values):
         attributes = dict(zip(strs, all_values))
 
-        for key, val in six.viewitems(attributes):
+        for key, val in attributes.items():
             experiment_run.log_attribute(key, val)
             with pytest.raises(ValueError):
                 experiment_run.log_attribute(key, val)
 
         # try it backwards, too
-        for key, val in reversed(list(six.viewitems(attributes))):
+        for key, val in reversed(list(attributes.items())):
             with pytest.raises(ValueError):
                 experiment_run.log_attribute(key, val)
 
@@ -181,7 +179,7 @@ class TestAttributes:
         scalar_values = (value for value in scalar_values if not isinstance(value, str))  # rm str
         attributes = dict(zip(scalar_values, scalar_values))
 
-        for key, val in six.viewitems(attributes):
+        for key, val in attributes.items():
             with pytest.raises(TypeError):
                 experiment_run.log_attribute(key, val)
 
@@ -197,13 +195,13 @@ class TestMetrics:
         strs, holdout = strs[:-1], strs[-1]  # reserve last key
         metrics = dict(zip(strs, scalar_values))
 
-        for key, val in six.viewitems(metrics):
+        for key, val in metrics.items():
             experiment_run.log_metric(key, val)
 
         with pytest.raises(KeyError):
             experiment_run.get_metric(holdout)
 
-        for key, val in six.viewitems(metrics):
+        for key, val in metrics.items():
             assert experiment_run.get_metric(key) == val
 
         assert experiment_run.get_metrics() == metrics
@@ -217,7 +215,7 @@ class TestMetrics:
         with pytest.raises(KeyError):
             experiment_run.get_metric(holdout)
 
-        for key, val in six.viewitems(metrics):
+        for key, val in metrics.items():
             assert experiment_run.get_metric(key) == val
 
         assert experiment_run.get_metrics() == metrics
@@ -225,13 +223,13 @@ class TestMetrics:
     def test_conflict(self, experiment_run, strs, scalar_values):
         metrics = dict(zip(strs, scalar_values))
 
-        for key, val in six.viewitems(metrics):
+        for key, val in metrics.items():
             experiment_run.log_metric(key, val)
             with pytest.raises(ValueError):
                 experiment_run.log_metric(key, val)
 
         # try it backwards, too
-        for key, val in reversed(list(six.viewitems(metrics))):
+        for key, val in reversed(list(metrics.items())):
             with pytest.raises(ValueError):
                 experiment_run.log_metric(key, val)
 
@@ -252,7 +250,7 @@ class TestMetrics:
         metrics = dict(zip(strs, collection_values))
 
         # single
-        for key, val in six.viewitems(metrics):
+        for key, val in metrics.items():
             with pytest.raises(TypeError):
                 experiment_run.log_metric(key, val)
 
@@ -275,14 +273,14 @@ class TestObservations:
             for key, scalar_value in zip(strs, scalar_values)
         }
 
-        for key, vals in six.viewitems(observations):
+        for key, vals in observations.items():
             for val in vals:
                 experiment_run.log_observation(key, val)
 
         with pytest.raises(KeyError):
             experiment_run.get_observation(holdout)
 
-        for key, val in six.viewitems(observations):
+        for key, val in observations.items():
             assert [obs_val for obs_val, _ in experiment_run.get_observation(key)] == val
 
         assert {key: [obs_val for obs_val, _ in obs_seq]
@@ -295,7 +293,7 @@ class TestObservations:
             for key, collection_value in zip(strs, collection_values)
         }
 
-        for key, vals in six.viewitems(observations):
+        for key, vals in observations.items():
             for val in vals:
                 with pytest.raises(TypeError):
                     experiment_run.log_observation(key, val)
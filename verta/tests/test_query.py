@@ -1,11 +1,9 @@
-import six
-
 import pytest
 
 import verta
 
 
-OPERATORS = six.viewkeys(verta.client.ExperimentRuns._OP_MAP)
+OPERATORS = verta.client.ExperimentRuns._OP_MAP.keys()
 
 
 class TestFind:
@@ -2,12 +2,43 @@
 
 import six
 
+import os
+
 import verta
 
 import pytest
 import utils
 
 
+class TestConnection:
+    def test_session_reused(self):
+        conn = verta._utils.Connection()
+
+        assert conn.session is conn.session
+
+    @pytest.mark.skipif(not hasattr(os, 'fork'), reason="requires os.fork()")
+    def test_session_rebuilt_after_fork(self):
+        conn = verta._utils.Connection()
+        parent_session_id = id(conn.session)
+
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:  # child
+            try:
+                os.close(read_fd)
+                os.write(write_fd, str(id(conn.session)).encode())
+                os.close(write_fd)
+            finally:
+                os._exit(0)
+        os.close(write_fd)
+        child_session_id = int(os.read(read_fd, 64))
+        os.close(read_fd)
+        os.waitpid(pid, 0)
+
+        assert child_session_id != parent_session_id
+        assert id(conn.session) == parent_session_id
+
+
 class TestToBuiltin:
     def test_string(self):
         val = "banana"
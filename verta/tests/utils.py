@@ -1,12 +1,14 @@
 import contextlib
+import copy
+import hashlib
+import multiprocessing.pool
 import random
 import os
+import threading
 from string import printable
 
 import requests
 
-import verta._utils
-
 from hypothesis import strategies as st
 
 
@@ -75,6 +77,8 @@ def st_json(draw, max_size=6):
 
 @st.composite
 def st_keys(draw):
+    import verta._utils
+
     return draw(st.text(sorted(verta._utils._VALID_FLAT_KEY_CHARS), min_size=1))
 
 
@@ -103,6 +107,48 @@ def chdir(new_dir):
         os.chdir(old_dir)
 
 
+def digest(stream, chunk_size=2**16):
+    """
+    Returns the BLAKE2b digest of a binary stream's contents, reading it in chunks.
+
+    This avoids pulling entire files into memory when comparing their contents.
+
+    """
+    hasher = hashlib.blake2b()
+    for chunk in iter(lambda: stream.read(chunk_size), b''):
+        hasher.update(chunk)
+    return hasher.digest()
+
+
+def map_with_own_session(fn, entity, iterable):
+    """
+    Calls `fn(entity_copy, item)` for each item in `iterable` using a thread pool, and returns the results.
+
+    :class:`requests.Session` is not documented as thread-safe, so each thread works through its
+    own copy of `entity` with its own HTTP session. The pool is capped at the default size of
+    :class:`requests.adapters.HTTPAdapter`'s connection pool.
+
+    """
+    items = list(iterable)
+    thread_locals = threading.local()
+
+    def call(item):
+        entity_copy = getattr(thread_locals, 'entity', None)
+        if entity_copy is None:
+            entity_copy = copy.copy(entity)
+            entity_copy._conn = copy.copy(entity._conn)
+            entity_copy._conn._session = None  # built on first request
+            thread_locals.entity = entity_copy
+        return fn(entity_copy, item)
+
+    pool = multiprocessing.pool.ThreadPool(max(min(len(items), requests.adapters.DEFAULT_POOLSIZE), 1))
+    try:
+        return pool.map(call, items)
+    finally:
+        pool.close()
+        pool.join()
+
+
 def delete_project(id_, conn):
     request_url = "{}://{}/v1/project/deleteProject".format(conn.scheme, conn.socket)
     response = requests.delete(request_url, json={'id': id_}, headers=conn.auth)
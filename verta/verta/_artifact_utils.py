@@ -4,6 +4,7 @@ from . import _six
 from ._six.moves import cPickle as pickle  # pylint: disable=import-error, no-name-in-module
 
 import csv
+import hashlib
 import importlib
 import json
 import os
@@ -21,11 +22,6 @@ try:
 except ImportError:  # joblib not installed
     pass
 
-try:
-    from tensorflow import keras
-except ImportError:  # TensorFlow not installed
-    pass
-
 
 # for process_requirements()
 PYPI_TO_IMPORT = {
@@ -41,6 +37,9 @@ IMPORT_TO_PYPI = {  # separate mapping because PyPI to import is surjective
 }
 REQ_SPEC_REGEX = re.compile(r"([a-zA-Z0-9._-]+)(.*)?")  # https://www.python.org/dev/peps/pep-0508/#names
 
+# for deserialize_model()
+HDF5_SIGNATURE = b"\x89HDF\r\n\x1a\n"  # https://support.hdfgroup.org/HDF5/doc/H5.format.html#Superblock
+
 
 def get_file_ext(file):
     """
@@ -125,6 +124,31 @@ def reset_stream(stream):
         pass
 
 
+def calc_sha256(bytestream, chunk_size=64*1024):
+    """
+    Calculates the SHA-256 checksum of a bytestream, reading it in chunks.
+
+    Parameters
+    ----------
+    bytestream : file-like opened in binary mode
+        Bytestream to calculate the checksum of. Its cursor will be reset to the beginning.
+    chunk_size : int, default 64 KiB
+        Number of bytes to read at a time.
+
+    Returns
+    -------
+    str
+        Hexadecimal SHA-256 checksum.
+
+    """
+    hasher = hashlib.sha256()
+    reset_stream(bytestream)
+    for chunk in iter(lambda: bytestream.read(chunk_size), b''):
+        hasher.update(chunk)
+    reset_stream(bytestream)
+    return hasher.hexdigest()
+
+
 def ensure_bytestream(obj):
     """
     Converts an object into a bytestream.
@@ -285,14 +309,20 @@ def deserialize_model(bytestring):
 
     """
     # try deserializing with Keras (HDF5)
-    with tempfile.NamedTemporaryFile() as tempf:
-        tempf.write(bytestring)
-        tempf.seek(0)
+    #     TensorFlow is only imported here, and only for HDF5 data, because it is very slow to import
+    if bytestring.startswith(HDF5_SIGNATURE):
         try:
-            return keras.models.load_model(tempf.name)
-        except (NameError,  # Tensorflow not installed
-                IOError, OSError):  # not a Keras model
+            from tensorflow import keras
+        except ImportError:  # TensorFlow not installed
             pass
+        else:
+            with tempfile.NamedTemporaryFile() as tempf:
+                tempf.write(bytestring)
+                tempf.seek(0)
+                try:
+                    return keras.models.load_model(tempf.name)
+                except (IOError, OSError):  # not a Keras model
+                    pass
 
     # try deserializing with cloudpickle
     bytestream = _six.BytesIO(bytestring)
@@ -23,13 +23,19 @@ from ._protos.public.modeldb import DatasetVersionService_pb2 as _DatasetVersion
 from . import _utils
 
 
+# for FilesystemDatasetVersionInfo.compute_file_hash()
+_FILE_HASH_CACHE = {}  # (path, device, inode, size, mtime) -> MD5 checksum, so unchanged files aren't re-read
+_FILE_HASH_CACHE_MAX_SIZE = 2**16
+_FILE_HASH_CACHE_MIN_AGE = 2  # seconds since modification before a checksum is cached; FAT's mtime resolution
+
+
 class Dataset(object):
     # TODO: delete is not supported on the API yet
     def __init__(self, conn, conf,
                  name=None, dataset_type=None,
                  desc=None, tags=None, attrs=None,
                  workspace=None,
-                 _dataset_id=None):
+                 _dataset_id=None, _dataset_msg=None):
         if name is not None and _dataset_id is not None:
             raise ValueError("cannot specify both `name` and `_dataset_id`")
 
@@ -38,7 +44,9 @@ class Dataset(object):
         else:
             WORKSPACE_PRINT_MSG = "personal workspace"
 
-        if _dataset_id is not None:
+        if _dataset_msg is not None:  # already retrieved, e.g. by a find query
+            dataset = _dataset_msg
+        elif _dataset_id is not None:
             dataset = Dataset._get(conn, _dataset_id=_dataset_id)
             if dataset is not None:
                 print("set existing Dataset: {}".format(dataset.name))
@@ -712,14 +720,22 @@ class FilesystemDatasetVersionInfo(PathDatasetVersionInfo):
         return dataset_part_infos
 
     def get_file_info(self, path):
+        stat = os.stat(path)
         dataset_part_info = _DatasetVersionService.DatasetPartInfo()
         dataset_part_info.path = path
-        dataset_part_info.size = os.path.getsize(path)
-        dataset_part_info.checksum = self.compute_file_hash(path)
-        dataset_part_info.last_modified_at_source = _utils.timestamp_to_ms(int(os.path.getmtime(path)))
+        dataset_part_info.size = stat.st_size
+        dataset_part_info.checksum = self.compute_file_hash(path, stat)
+        dataset_part_info.last_modified_at_source = _utils.timestamp_to_ms(int(stat.st_mtime))
         return dataset_part_info
 
-    def compute_file_hash(self, path):
+    def compute_file_hash(self, path, stat=None):
+        if stat is None:
+            stat = os.stat(path)
+        mtime = getattr(stat, 'st_mtime_ns', stat.st_mtime)  # nanoseconds unavailable in Python 2
+        cache_key = (path, stat.st_dev, stat.st_ino, stat.st_size, mtime)
+        if cache_key in _FILE_HASH_CACHE:
+            return _FILE_HASH_CACHE[cache_key]
+
         BLOCKSIZE = 65536
         hasher = hashlib.md5()
         with open(path, 'rb') as afile:
@@ -727,7 +743,15 @@ class FilesystemDatasetVersionInfo(PathDatasetVersionInfo):
             while len(buf) > 0:
                 hasher.update(buf)
                 buf = afile.read(BLOCKSIZE)
-        return hasher.hexdigest()
+        checksum = hasher.hexdigest()
+
+        # a file rewritten within the same mtime tick it was hashed in could keep its cache key, so
+        # only cache checksums of files that were last modified before the current tick
+        if time.time() - stat.st_mtime > _FILE_HASH_CACHE_MIN_AGE:
+            if len(_FILE_HASH_CACHE) >= _FILE_HASH_CACHE_MAX_SIZE:
+                _FILE_HASH_CACHE.clear()
+            _FILE_HASH_CACHE[cache_key] = checksum
+        return checksum
 
 
 class S3DatasetVersionInfo(PathDatasetVersionInfo):
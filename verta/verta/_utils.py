@@ -25,11 +25,6 @@ from google.protobuf.struct_pb2 import Value, ListValue, Struct, NULL_VALUE
 
 from ._protos.public.modeldb import CommonService_pb2 as _CommonService
 
-try:
-    import pandas as pd
-except ImportError:  # pandas not installed
-    pass
-
 try:
     import ipykernel
 except ImportError:  # Jupyter not installed
@@ -89,6 +84,33 @@ class Connection:
                            raise_on_redirect=False,  # return Response instead of raising after max retries
                            raise_on_status=False)  # return Response instead of raising after max retries
         self.ignore_conn_err = ignore_conn_err
+        self._session = None
+        self._session_pid = None
+
+    @property
+    def session(self):
+        """
+        HTTP session shared by requests made through this connection.
+
+        Reusing a single session keeps connections to the back end alive between requests, rather
+        than establishing a new one each time. A forked child process gets a new session, so that
+        it doesn't share its parent's open sockets.
+
+        Returns
+        -------
+        :class:`requests.Session`
+
+        """
+        # attributes may be missing if unpickled from an older version
+        if (getattr(self, '_session', None) is None
+                or getattr(self, '_session_pid', None) != os.getpid()):
+            session = requests.Session()
+            adapter = HTTPAdapter(max_retries=self.retry)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._session = session
+            self._session_pid = os.getpid()
+        return self._session
 
 
 class Configuration:
@@ -133,22 +155,20 @@ def make_request(method, url, conn, **kwargs):
         # add auth to `kwargs['headers']`
         kwargs.setdefault('headers', {}).update(conn.auth)
 
-    with requests.Session() as s:
-        s.mount(url, HTTPAdapter(max_retries=conn.retry))
-        try:
-            response = s.request(method, url, **kwargs)
-        except (requests.exceptions.BaseHTTPError,
-                requests.exceptions.RequestException) as e:
-            if not conn.ignore_conn_err:
-                raise e
-        else:
-            if response.ok or not conn.ignore_conn_err:
-                return response
-        # fabricate response
-        response = requests.Response()
-        response.status_code = 200  # success
-        response._content = _six.ensure_binary("{}")  # empty contents
-        return response
+    try:
+        response = conn.session.request(method, url, **kwargs)
+    except (requests.exceptions.BaseHTTPError,
+            requests.exceptions.RequestException) as e:
+        if not conn.ignore_conn_err:
+            raise e
+    else:
+        if response.ok or not conn.ignore_conn_err:
+            return response
+    # fabricate response
+    response = requests.Response()
+    response.status_code = 200  # success
+    response._content = _six.ensure_binary("{}")  # empty contents
+    return response
 
 
 def raise_for_http_error(response):
@@ -610,11 +630,13 @@ def ensure_timestamp(timestamp):
 
     """
     if isinstance(timestamp, _six.string_types):
-        try:  # attempt with pandas, which can parse many time string formats
-            return timestamp_to_ms(pd.Timestamp(timestamp).timestamp())
-        except NameError:  # pandas not installed
+        try:  # imported here because pandas is slow to import and only needed for this
+            import pandas as pd
+        except ImportError:  # pandas not installed
             _six.raise_from(ValueError("pandas must be installed to parse datetime strings"),
                            None)
+        try:  # attempt with pandas, which can parse many time string formats
+            return timestamp_to_ms(pd.Timestamp(timestamp).timestamp())
         except ValueError:  # can't be handled by pandas
             _six.raise_from(ValueError("unable to parse datetime string \"{}\"".format(timestamp)),
                            None)
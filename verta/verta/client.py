@@ -528,7 +528,7 @@ class Client(object):
         _utils.raise_for_http_error(response)
 
         response_msg = _utils.json_to_proto(response.json(), Message.Response)
-        return [_dataset.Dataset(self._conn, self._conf, _dataset_id=dataset.id)
+        return [_dataset.Dataset(self._conn, self._conf, _dataset_msg=dataset)
                 for dataset in response_msg.datasets]
 
     def get_dataset_version(self, id):
@@ -1774,8 +1774,8 @@ class ExperimentRun(_ModelDBEntity):
             Name of the artifact.
         artifact : str or file-like or object
             Artifact or some representation thereof.
-                - If str, then it will be interpreted as a filesystem path, its contents read as bytes,
-                  and uploaded as an artifact.
+                - If str, then it will be interpreted as a filesystem path, and the file will be
+                  streamed from disk and uploaded as an artifact.
                 - If file-like, then the contents will be read as bytes and uploaded as an artifact.
                 - Otherwise, the object will be serialized and uploaded as an artifact.
         artifact_type : int
@@ -1789,19 +1789,44 @@ class ExperimentRun(_ModelDBEntity):
 
         """
         if isinstance(artifact, _six.string_types):
-            artifact = open(artifact, 'rb')
-
-        if hasattr(artifact, 'read') and method is not None:  # already a verta-produced stream
+            # stream straight from disk, rather than reading the file into memory
+            with open(artifact, 'rb') as artifact_stream:
+                if not os.fstat(artifact_stream.fileno()).st_size:
+                    raise ValueError("object contains no data")
+                self._upload_artifact_stream(key, artifact_stream, artifact_type, extension, method, overwrite)
+            return
+        elif hasattr(artifact, 'read') and method is not None:  # already a verta-produced stream
             artifact_stream = artifact
         else:
             artifact_stream, method = _artifact_utils.ensure_bytestream(artifact)
 
+        self._upload_artifact_stream(key, artifact_stream, artifact_type, extension, method, overwrite)
+
+    def _upload_artifact_stream(self, key, artifact_stream, artifact_type, extension=None, method=None, overwrite=False):
+        """
+        Logs the bytes of `artifact_stream` as an artifact to this Experiment Run.
+
+        Parameters
+        ----------
+        key : str
+            Name of the artifact.
+        artifact_stream : file-like
+            Seekable bytestream of the artifact's contents.
+        artifact_type : int
+            Variant of `_CommonService.ArtifactTypeEnum`.
+        extension : str, optional
+            Filename extension associated with the artifact.
+        method : str, optional
+            Serialization method used to produce the bytestream, if it was serialized by verta.
+        overwrite : bool, default False
+            Whether to allow overwriting an existing artifact with key `key`.
+
+        """
         if extension is None:
             extension = _artifact_utils.ext_from_method(method)
 
         # calculate checksum
-        artifact_hash = hashlib.sha256(artifact_stream.read()).hexdigest()
-        artifact_stream.seek(0)
+        artifact_hash = _artifact_utils.calc_sha256(artifact_stream)
 
         # determine basename
         #     The key might already contain the file extension, thanks to our hard-coded deployment
@@ -1844,7 +1869,8 @@ class ExperimentRun(_ModelDBEntity):
         url = self._get_url_for_artifact(key, "PUT")
         artifact_stream.seek(0)  # reuse stream that was created for checksum
         if self._conf.debug:
-            print("[DEBUG] uploading {} bytes ({})".format(len(artifact_stream.read()), basename))
+            artifact_stream.seek(0, os.SEEK_END)
+            print("[DEBUG] uploading {} bytes ({})".format(artifact_stream.tell(), basename))
             artifact_stream.seek(0)
 
         # accommodate port-forwarded NFS store
@@ -2471,8 +2497,8 @@ class ExperimentRun(_ModelDBEntity):
             Name of the dataset.
         dataset : str or file-like or object
             Dataset or some representation thereof.
-                - If str, then it will be interpreted as a filesystem path, its contents read as bytes,
-                  and uploaded as an artifact.
+                - If str, then it will be interpreted as a filesystem path, and the file's contents
+                  will be uploaded as an artifact.
                 - If file-like, then the contents will be read as bytes and uploaded as an artifact.
                 - If type is Dataset, then it will log a dataset version
                 - Otherwise, the object will be serialized and uploaded as an artifact.
@@ -2629,19 +2655,19 @@ class ExperimentRun(_ModelDBEntity):
         ----------
         model : str or file-like or object
             Model or some representation thereof.
-                - If str, then it will be interpreted as a filesystem path, its contents read as bytes,
-                  and uploaded as an artifact.
+                - If str, then it will be interpreted as a filesystem path, and the file's contents
+                  will be uploaded as an artifact.
                 - If file-like, then the contents will be read as bytes and uploaded as an artifact.
                 - Otherwise, the object will be serialized and uploaded as an artifact.
         model_api : str or file-like
             Model API, specifying model deployment and predictions.
-                - If str, then it will be interpreted as a filesystem path, its contents read as bytes,
-                  and uploaded as an artifact.
+                - If str, then it will be interpreted as a filesystem path, and the file's contents
+                  will be uploaded as an artifact.
                 - If file-like, then the contents will be read as bytes and uploaded as an artifact.
         requirements : str or file-like
             pip requirements file specifying packages necessary to deploy the model.
-                - If str, then it will be interpreted as a filesystem path, its contents read as bytes,
-                  and uploaded as an artifact.
+                - If str, then it will be interpreted as a filesystem path, and the file's contents
+                  will be uploaded as an artifact.
                 - If file-like, then the contents will be read as bytes and uploaded as an artifact.
         train_features : pd.DataFrame, optional
             pandas DataFrame representing features of the training data. If provided, `train_targets`
@@ -2851,8 +2877,8 @@ class ExperimentRun(_ModelDBEntity):
             Name of the image.
         image : one of {str, file-like, pyplot, matplotlib Figure, PIL Image, object}
             Image or some representation thereof.
-                - If str, then it will be interpreted as a filesystem path, its contents read as bytes,
-                  and uploaded as an artifact.
+                - If str, then it will be interpreted as a filesystem path, and the file's contents
+                  will be uploaded as an artifact.
                 - If file-like, then the contents will be read as bytes and uploaded as an artifact.
                 - If matplotlib pyplot, then the image will be serialized and uploaded as an artifact.
                 - If matplotlib Figure, then the image will be serialized and uploaded as an artifact.
@@ -2947,8 +2973,8 @@ class ExperimentRun(_ModelDBEntity):
             Name of the artifact.
         artifact : str or file-like or object
             Artifact or some representation thereof.
-                - If str, then it will be interpreted as a filesystem path, its contents read as bytes,
-                  and uploaded as an artifact. If it is a directory path, its contents will be zipped.
+                - If str, then it will be interpreted as a filesystem path, and the file's contents
+                  will be uploaded as an artifact. If it is a directory path, its contents will be zipped.
                 - If file-like, then the contents will be read as bytes and uploaded as an artifact.
                 - Otherwise, the object will be serialized and uploaded as an artifact.
         overwrite : bool, default False
@@ -3123,11 +3149,12 @@ class ExperimentRun(_ModelDBEntity):
 
         Parameters
         ----------
-        requirements : str or list of str
+        requirements : str, list of str, or file-like
             PyPI-installable packages necessary to deploy the model.
                 - If str, then it will be interpreted as a filesystem path to a requirements file
                   for upload.
                 - If list of str, then it will be interpreted as a list of PyPI package names.
+                - If file-like, then its contents will be read as a requirements file.
         overwrite : bool, default False
             Whether to allow overwriting existing requirements.
 
@@ -3160,9 +3187,12 @@ class ExperimentRun(_ModelDBEntity):
             scikit-learn==0.21.3
 
         """
-        if isinstance(requirements, _six.string_types):
-            with open(requirements, 'r') as f:
-                requirements = f.readlines()
+        if isinstance(requirements, _six.string_types) or hasattr(requirements, 'read'):
+            if hasattr(requirements, 'read'):  # if file-like
+                requirements = [_six.ensure_str(req) for req in requirements.readlines()]
+            else:
+                with open(requirements, 'r') as f:
+                    requirements = f.readlines()
 
             # clean
             requirements = [req.strip() for req in requirements]
@@ -3176,7 +3206,8 @@ class ExperimentRun(_ModelDBEntity):
             for i, req in enumerate(requirements):
                 requirements[i] = _artifact_utils.IMPORT_TO_PYPI.get(req, req)
         else:
-            raise TypeError("`requirements` must be either str or list of str, not {}".format(type(requirements)))
+            raise TypeError("`requirements` must be either str, list of str, or file-like,"
+                            " not {}".format(type(requirements)))
 
         requirements = _artifact_utils.process_requirements(requirements)
 
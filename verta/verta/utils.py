@@ -11,11 +11,6 @@ import tempfile
 import warnings
 import zipfile
 
-try:
-    import tensorflow as tf
-except ImportError:  # TensorFlow not installed
-    tf = None
-
 from . import _utils
 
 
@@ -218,8 +213,11 @@ class TFSavedModel(object):
 
     """
     def __init__(self, saved_model_dir, session=None):
-        if tf is None:
-            raise ImportError("TensorFlow is not installed; try `pip install tensorflow`")
+        try:  # imported here because TensorFlow is very slow to import
+            import tensorflow as tf
+        except ImportError:  # TensorFlow not installed
+            _six.raise_from(ImportError("TensorFlow is not installed; try `pip install tensorflow`"),
+                            None)
 
         self.saved_model_dir = saved_model_dir
         self.session = session or tf.Session()
@@ -238,6 +236,8 @@ class TFSavedModel(object):
         return {}  # no state needs to be saved
 
     def __setstate__(self, state):
+        import tensorflow as tf
+
         self.__dict__.update(state)
 
         self.saved_model_dir = _utils.SAVED_MODEL_DIR
@@ -248,6 +248,8 @@ class TFSavedModel(object):
         self.output_tensors = output_tensors
 
     def _map_tensors(self):
+        import tensorflow as tf
+
         # obtain info about input/output signature
         meta_graph_def = tf.compat.v1.saved_model.load(self.session, ['serve'], self.saved_model_dir)
 